@@ -4,44 +4,205 @@ Network Ping Tool
 A cross-platform utility for testing network connectivity and latency
 """
 
+import asyncio
+import codecs
+import concurrent.futures
+import functools
 import subprocess
 import platform
 import re
+import select
+import struct
+import io
+import ipaddress
+import itertools
 import os
+import shutil
+import string
+import sys
+import socket
+import time
 from datetime import datetime
 
+# google-re2 scans in linear time and handles the output alternations
+# without backtracking; fall back to the stdlib engine when it's missing
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
+
+# The OS can't change while we run, so detect it once at import time
+_SYSTEM = platform.system().lower()
+_IS_WINDOWS = _SYSTEM == "windows"
+
+# Separator lines used by the menu, reports and log entries
+_EQ60 = "=" * 60
+_DASH60 = "-" * 60
+# A log entry starts with a blank line followed by the separator
+_LOG_ENTRY_START = ("\n\n" + _EQ60).encode()
+
+# Characters allowed in a domain label (letters, digits, hyphen)
+_LABEL_CHARS = frozenset(string.ascii_letters + string.digits + "-")
+_TLD_CHARS = frozenset(string.ascii_letters)
+
+# Ping output is scanned once with a single alternation per platform; the
+# outer group name (match.lastgroup) tells the parser which line hit.
+# Windows format:
+#   "Reply from 8.8.8.8: bytes=32 time=14ms TTL=117"
+#   "Packets: Sent = 4, Received = 4, Lost = 0 (0% loss)"
+#   "Minimum = 1ms, Maximum = 4ms, Average = 2ms"
+_WIN_OUTPUT_RE = _re.compile(
+    r'(?P<time>(?i:time[=<](?P<time_ms>\d+)ms))'
+    r'|(?P<packets>Sent = (?P<sent>\d+), Received = (?P<received>\d+), Lost = (?P<lost>\d+))'
+    r'|(?P<stats>Minimum = (?P<min>\d+)ms, Maximum = (?P<max>\d+)ms, Average = (?P<avg>\d+)ms)'
+)
+
+# Linux/Mac format:
+#   "64 bytes from 8.8.8.8: icmp_seq=1 ttl=117 time=14.2 ms"
+#   "4 packets transmitted, 4 received, 0% packet loss"
+#   "rtt min/avg/max/mdev = 1.234/2.345/3.456/0.567 ms"
+_NIX_OUTPUT_RE = _re.compile(
+    r'(?P<time>(?i:time=(?P<time_ms>\d+\.?\d*)\s*ms))'
+    r'|(?P<packets>(?P<sent>\d+) packets transmitted, (?P<received>\d+) received)'
+    r'|(?P<loss>(?P<loss_pct>\d+\.?\d*)% packet loss)'
+    r'|(?P<stats>rtt min/avg/max/[a-z]+ = (?P<min>[\d.]+)/(?P<avg>[\d.]+)/(?P<max>[\d.]+))'
+)
+
+# Latency indicators for display_results: < 50ms, < 150ms, slower
+_LATENCY_STATUS = ("🟢", "🟡", "🔴")
+
+# Upper bound on ping processes running at once in ping_many; unbounded
+# fan-out floods the link and shows up as spurious packet loss
+MAX_CONCURRENT_PINGS = 32
+
+# Error messages shared by ping() and ping_many()
+_INVALID_TARGET_ERROR = "Invalid IP address or domain name"
+_TIMEOUT_ERROR = "Ping command timed out"
+
+# How long (seconds) a resolved domain is reused before looking it up again
+DNS_CACHE_TTL = 15 * 60
+
+# ICMP echo settings for the in-process (socket) ping path
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+ECHO_PAYLOAD = b'\x00' * 56
+ECHO_REPLY_TIMEOUT = 2.0
+# Per-call echo identifiers, so concurrent _ping_socket() calls from
+# ping_many() never share one (itertools.count is safe across threads)
+_ECHO_IDS = itertools.count(os.getpid())
+
+
+def icmp_checksum(data):
+    """Internet checksum (RFC 1071) of an ICMP message"""
+    if len(data) % 2:
+        data += b'\x00'
+    total = sum(struct.unpack(f'!{len(data) // 2}H', data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+@functools.lru_cache(maxsize=1024)
+def _validate(target):
+    """Classify a target as ("ip" | "domain") or reject it, memoized per string"""
+    # IPv4Address parses and range-checks (0-255) the octets in one go
+    try:
+        ipaddress.IPv4Address(target)
+        return True, "ip"
+    except ipaddress.AddressValueError:
+        pass
+    
+    if target == "localhost" or _is_domain(target):
+        return True, "domain"
+    
+    return False, None
+
+
+def _is_domain(target):
+    """Check a dotted host name label by label (no regex, so no backtracking)"""
+    *labels, tld = target.split('.')
+    if not labels or len(tld) < 2 or not _TLD_CHARS.issuperset(tld):
+        return False
+    
+    for label in labels:
+        # 1-63 characters, no leading/trailing hyphen
+        if not 0 < len(label) <= 63 or label[0] == '-' or label[-1] == '-':
+            return False
+        if not _LABEL_CHARS.issuperset(label):
+            return False
+    
+    return True
+
 
 class PingTool:
     """Network ping utility with result parsing and logging"""
     
-    def __init__(self, log_file="logs.txt"):
+    def __init__(self, log_file="logs.txt", resolve_names=False):
         self.log_file = log_file
-        self.system = platform.system().lower()
+        # Reverse-DNS lookups per reply are slow, so they are off by default
+        self.resolve_names = resolve_names
+        # domain -> (IPv4 address, expiry time on the monotonic clock)
+        self._dns_cache = {}
+        # O_APPEND descriptor kept open across log_results() calls, opened lazily
+        self._log_fd = None
+        self.system = _SYSTEM
+        # Bind the platform-specific parser once
+        self._parse = self._parse_windows if _IS_WINDOWS else self._parse_linux
         
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __del__(self):
+        self.close()
+    
+    def close(self):
+        """Close the log file descriptor"""
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
+    
+    def _ensure_log(self):
+        """Open the log file for raw appending on first use"""
+        if self._log_fd is None:
+            self._log_fd = os.open(self.log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        return self._log_fd
+    
     def validate_target(self, target):
         """Validate IP address or domain name"""
-        # Basic validation for IP or domain
-        ip_pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-        domain_pattern = r'^([a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$'
+        return _validate(target)
+    
+    def _resolve(self, target):
+        """Resolve a domain to an IPv4 address, caching it for DNS_CACHE_TTL"""
+        now = time.monotonic()
+        cached = self._dns_cache.get(target)
+        if cached and cached[1] > now:
+            return cached[0]
         
-        if re.match(ip_pattern, target):
-            # Validate IP range (0-255)
-            octets = target.split('.')
-            if all(0 <= int(octet) <= 255 for octet in octets):
-                return True, "ip"
-        elif re.match(domain_pattern, target) or target == "localhost":
-            return True, "domain"
+        try:
+            address = socket.getaddrinfo(target, None, socket.AF_INET)[0][4][0]
+        except socket.gaierror:
+            # Hand the name on unchanged; the socket path skips unresolved
+            # hosts and the ping binary reports them
+            return target
         
-        return False, None
+        self._dns_cache[target] = (address, now + DNS_CACHE_TTL)
+        return address
     
     def build_ping_command(self, target, count=4):
         """Build platform-specific ping command"""
-        if self.system == "windows":
-            # Windows: ping -n <count> <target>
+        if _IS_WINDOWS:
+            # Windows: ping -n <count> <target> (-a to resolve names)
+            if self.resolve_names:
+                return ["ping", "-a", "-n", str(count), target]
             return ["ping", "-n", str(count), target]
         else:
-            # Linux/Mac: ping -c <count> <target>
-            return ["ping", "-c", str(count), target]
+            # Linux/Mac: ping -c <count> <target> (-n for numeric output only)
+            if self.resolve_names:
+                return ["ping", "-c", str(count), target]
+            return ["ping", "-n", "-c", str(count), target]
     
     def parse_ping_output(self, output):
         """Parse ping command output and extract statistics"""
@@ -57,60 +218,15 @@ class PingTool:
         }
         
         try:
-            lines = output.split('\n')
-            
-            # Extract individual ping times
-            if self.system == "windows":
-                time_pattern = r'time[=<](\d+)ms'
-            else:
-                time_pattern = r'time=(\d+\.?\d*)\s*ms'
-            
-            for line in lines:
-                match = re.search(time_pattern, line, re.IGNORECASE)
-                if match:
-                    time_ms = float(match.group(1))
-                    results["times"].append(time_ms)
-            
-            # Extract packet statistics
-            if self.system == "windows":
-                # Windows format: "Packets: Sent = 4, Received = 4, Lost = 0 (0% loss)"
-                packets_match = re.search(r'Sent = (\d+), Received = (\d+), Lost = (\d+)', output)
-                if packets_match:
-                    results["packets_sent"] = int(packets_match.group(1))
-                    results["packets_received"] = int(packets_match.group(2))
-                    lost = int(packets_match.group(3))
-                    if results["packets_sent"] > 0:
-                        results["packet_loss"] = (lost / results["packets_sent"]) * 100
-                
-                # Windows time stats: "Minimum = 1ms, Maximum = 4ms, Average = 2ms"
-                stats_match = re.search(r'Minimum = (\d+)ms, Maximum = (\d+)ms, Average = (\d+)ms', output)
-                if stats_match:
-                    results["min_time"] = float(stats_match.group(1))
-                    results["max_time"] = float(stats_match.group(2))
-                    results["avg_time"] = float(stats_match.group(3))
-            else:
-                # Linux/Mac format: "4 packets transmitted, 4 received, 0% packet loss"
-                packets_match = re.search(r'(\d+) packets transmitted, (\d+) received', output)
-                if packets_match:
-                    results["packets_sent"] = int(packets_match.group(1))
-                    results["packets_received"] = int(packets_match.group(2))
-                
-                loss_match = re.search(r'(\d+\.?\d*)% packet loss', output)
-                if loss_match:
-                    results["packet_loss"] = float(loss_match.group(1))
-                
-                # Linux/Mac time stats: "rtt min/avg/max/mdev = 1.234/2.345/3.456/0.567 ms"
-                stats_match = re.search(r'rtt min/avg/max/[a-z]+ = ([\d.]+)/([\d.]+)/([\d.]+)', output)
-                if stats_match:
-                    results["min_time"] = float(stats_match.group(1))
-                    results["avg_time"] = float(stats_match.group(2))
-                    results["max_time"] = float(stats_match.group(3))
+            # Single scan with the parser bound in __init__
+            self._parse(output, results)
             
             # If we got times manually, calculate stats if not found
-            if results["times"] and not results["avg_time"]:
-                results["min_time"] = min(results["times"])
-                results["max_time"] = max(results["times"])
-                results["avg_time"] = sum(results["times"]) / len(results["times"])
+            times = results["times"]
+            if times and not results["avg_time"]:
+                results["min_time"] = min(times)
+                results["max_time"] = max(times)
+                results["avg_time"] = sum(times) / len(times)
             
             # Mark as successful if we received any packets
             results["success"] = results["packets_received"] > 0
@@ -120,145 +236,388 @@ class PingTool:
         
         return results
     
+    def _parse_windows(self, output, results):
+        """Fill results from Windows ping output"""
+        for match in _WIN_OUTPUT_RE.finditer(output):
+            kind = match.lastgroup
+            if kind == "time":
+                # Windows only reports whole milliseconds
+                results["times"].append(int(match.group("time_ms")))
+            elif kind == "packets":
+                results["packets_sent"] = int(match.group("sent"))
+                results["packets_received"] = int(match.group("received"))
+                lost = int(match.group("lost"))
+                if results["packets_sent"] > 0:
+                    results["packet_loss"] = (lost / results["packets_sent"]) * 100
+            elif kind == "stats":
+                results["min_time"] = float(match.group("min"))
+                results["max_time"] = float(match.group("max"))
+                results["avg_time"] = float(match.group("avg"))
+    
+    def _parse_linux(self, output, results):
+        """Fill results from Linux/Mac ping output"""
+        for match in _NIX_OUTPUT_RE.finditer(output):
+            kind = match.lastgroup
+            if kind == "time":
+                results["times"].append(float(match.group("time_ms")))
+            elif kind == "packets":
+                results["packets_sent"] = int(match.group("sent"))
+                results["packets_received"] = int(match.group("received"))
+            elif kind == "loss":
+                results["packet_loss"] = float(match.group("loss_pct"))
+            elif kind == "stats":
+                results["min_time"] = float(match.group("min"))
+                results["avg_time"] = float(match.group("avg"))
+                results["max_time"] = float(match.group("max"))
+    
     def ping(self, target, count=4, show_output=True):
         """Execute ping command and return results"""
         # Validate target
         is_valid, target_type = self.validate_target(target)
         if not is_valid:
-            return {
-                "success": False,
-                "error": "Invalid IP address or domain name"
-            }
+            return self._error_result(target, _INVALID_TARGET_ERROR)
         
         if show_output:
-            print(f"\n{'=' * 60}")
+            print(f"\n{_EQ60}")
             print(f"🌐 Pinging {target} ({target_type})...")
-            print(f"{'=' * 60}\n")
+            print(f"{_EQ60}\n")
         
         try:
-            # Build and execute ping command
-            command = self.build_ping_command(target, count)
+            host = self._lookup_host(target, target_type)
+            
+            # Prefer pinging in-process; fall back to the system ping binary
+            # when ICMP sockets are unavailable (Windows, permission denied)
+            socket_results = self._ping_socket(host, count)
+            if socket_results is not None:
+                return self._add_metadata(socket_results, target, target_type, "")
             
-            # Run ping command
+            # Build and run ping command
             result = subprocess.run(
-                command,
+                self.build_ping_command(host, count),
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+                stderr=subprocess.DEVNULL,
                 timeout=30
             )
+            return self._results_from_output(result.stdout, target, target_type)
+            
+        except subprocess.TimeoutExpired:
+            return self._error_result(target, _TIMEOUT_ERROR)
+        except Exception as e:
+            return self._error_result(target, str(e))
+    
+    async def ping_many(self, targets, count=4):
+        """Ping several targets concurrently, returning results in input order"""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PINGS)
+        
+        # DNS lookups and socket pings block, so each gets its own worker
+        with concurrent.futures.ThreadPoolExecutor(MAX_CONCURRENT_PINGS) as executor:
+            async def ping_one(target):
+                async with semaphore:
+                    return await self._ping_async(target, count, executor)
             
-            # Parse output
-            output = result.stdout
-            parsed_results = self.parse_ping_output(output)
+            return await asyncio.gather(*(ping_one(target) for target in targets))
+    
+    async def _ping_async(self, target, count, executor):
+        """Non-blocking counterpart of ping() used by ping_many()"""
+        is_valid, target_type = self.validate_target(target)
+        if not is_valid:
+            return self._error_result(target, _INVALID_TARGET_ERROR)
+        
+        try:
+            loop = asyncio.get_running_loop()
+            host = await loop.run_in_executor(executor, self._lookup_host, target, target_type)
             
-            # Add metadata
-            parsed_results["target"] = target
-            parsed_results["target_type"] = target_type
-            parsed_results["timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            parsed_results["raw_output"] = output
+            socket_results = await loop.run_in_executor(executor, self._ping_socket, host, count)
+            if socket_results is not None:
+                return self._add_metadata(socket_results, target, target_type, "")
             
-            return parsed_results
+            process = await asyncio.create_subprocess_exec(
+                *self.build_ping_command(host, count),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            
+            try:
+                stdout, _ = await asyncio.wait_for(process.communicate(), timeout=30)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                return self._error_result(target, _TIMEOUT_ERROR)
+            
+            return self._results_from_output(stdout, target, target_type)
             
-        except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "error": "Ping command timed out",
-                "target": target
-            }
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "target": target
-            }
+            return self._error_result(target, str(e))
+    
+    def _lookup_host(self, target, target_type):
+        """Address to hand to ping; domains are resolved up front so ping
+        skips its own DNS lookup"""
+        return self._resolve(target) if target_type == "domain" else target
+    
+    def _results_from_output(self, stdout, target, target_type):
+        """Parse raw ping stdout (plain ASCII) into results with metadata"""
+        output = stdout.decode('ascii', 'ignore')
+        return self._add_metadata(self.parse_ping_output(output), target, target_type, output)
+    
+    def _error_result(self, target, error):
+        """Failure result in the shape display_results()/log_results() expect"""
+        return {
+            "success": False,
+            "error": error,
+            "target": target
+        }
+    
+    def _ping_socket(self, host, count):
+        """Ping with an unprivileged ICMP datagram socket instead of a subprocess
+        
+        Echo requests are sent back-to-back and their round trips timed
+        in-process. Returns None when the socket path can't be used (no
+        ICMP sockets, unresolved host, send failure) so the caller falls
+        back to the ping binary, which reports such errors itself.
+        """
+        if _IS_WINDOWS:
+            return None
+        
+        try:
+            ipaddress.IPv4Address(host)
+        except ipaddress.AddressValueError:
+            return None
+        
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+        except OSError:
+            return None
+        
+        ident = next(_ECHO_IDS) & 0xFFFF
+        # Linux rewrites the identifier to the socket's own id and only
+        # delivers replies for it; elsewhere we must filter on it ourselves
+        check_ident = _SYSTEM != "linux"
+        sent_at = {}
+        replies = {}
+        
+        def read_reply(timeout):
+            """Record one reply; False if nothing arrived within timeout"""
+            readable, _, _ = select.select([sock], [], [], timeout)
+            if not readable:
+                return False
+            
+            packet, (source, _) = sock.recvfrom(1024)
+            received_at = time.perf_counter()
+            # Only the host we pinged can answer this socket's requests;
+            # an unconnected ICMP socket may see other hosts' replies too
+            if source != host:
+                return True
+            # macOS includes the IP header on datagram ICMP sockets
+            if packet and packet[0] >> 4 == 4:
+                packet = packet[(packet[0] & 0x0F) * 4:]
+            if len(packet) < 8:
+                return True
+            
+            icmp_type, _, _, reply_ident, seq = struct.unpack('!BBHHH', packet[:8])
+            if icmp_type != ICMP_ECHO_REPLY or (check_ident and reply_ident != ident):
+                return True
+            if seq in sent_at and seq not in replies:
+                replies[seq] = (received_at - sent_at[seq]) * 1000
+            return True
+        
+        with sock:
+            try:
+                for seq in range(1, count + 1):
+                    header = struct.pack('!BBHHH', ICMP_ECHO_REQUEST, 0, 0, ident, seq)
+                    checksum = icmp_checksum(header + ECHO_PAYLOAD)
+                    header = struct.pack('!BBHHH', ICMP_ECHO_REQUEST, 0, checksum, ident, seq)
+                    sent_at[seq] = time.perf_counter()
+                    sock.sendto(header + ECHO_PAYLOAD, (host, 0))
+                    
+                    # Pick up replies that are already in, so building and
+                    # sending the later requests isn't counted in their RTT
+                    while read_reply(0):
+                        pass
+                
+                deadline = time.perf_counter() + ECHO_REPLY_TIMEOUT
+                while len(replies) < count:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0 or not read_reply(remaining):
+                        break
+            except OSError:
+                # e.g. EPERM from a firewall or ENETUNREACH
+                return None
+        
+        times = [replies[seq] for seq in sorted(replies)]
+        results = {
+            "packets_sent": count,
+            "packets_received": len(times),
+            "packet_loss": (count - len(times)) / count * 100,
+            "min_time": None,
+            "avg_time": None,
+            "max_time": None,
+            "times": times,
+            "success": bool(times)
+        }
+        if times:
+            results["min_time"] = min(times)
+            results["max_time"] = max(times)
+            results["avg_time"] = sum(times) / len(times)
+        
+        return results
+    
+    def _add_metadata(self, results, target, target_type, output):
+        """Attach target metadata to parsed ping results"""
+        results["target"] = target
+        results["target_type"] = target_type
+        results["timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        results["raw_output"] = output
+        
+        return results
     
     def display_results(self, results):
         """Display ping results in a formatted way"""
+        # The report is collected and written in one go
         if not results["success"]:
-            print(f"\n❌ Ping Failed")
+            parts = ["\n❌ Ping Failed\n"]
             if "error" in results:
-                print(f"   Error: {results['error']}")
-            print()
+                parts.append(f"   Error: {results['error']}\n")
+            parts.append("\n")
+            sys.stdout.write(''.join(parts))
             return
         
-        print(f"✅ Ping Successful!")
-        print(f"\n📊 Statistics for {results['target']}:")
-        print("-" * 60)
-        print(f"  Packets Sent:     {results['packets_sent']}")
-        print(f"  Packets Received: {results['packets_received']}")
-        print(f"  Packet Loss:      {results['packet_loss']:.1f}%")
+        parts = [
+            "✅ Ping Successful!\n",
+            f"\n📊 Statistics for {results['target']}:\n",
+            _DASH60 + "\n",
+            f"  Packets Sent:     {results['packets_sent']}\n",
+            f"  Packets Received: {results['packets_received']}\n",
+            f"  Packet Loss:      {results['packet_loss']:.1f}%\n"
+        ]
         
         if results['min_time'] is not None:
-            print(f"\n⏱️  Latency:")
-            print("-" * 60)
-            print(f"  Minimum:  {results['min_time']:.2f} ms")
-            print(f"  Average:  {results['avg_time']:.2f} ms")
-            print(f"  Maximum:  {results['max_time']:.2f} ms")
+            parts.append("\n⏱️  Latency:\n")
+            parts.append(_DASH60 + "\n")
+            parts.append(f"  Minimum:  {results['min_time']:.2f} ms\n")
+            parts.append(f"  Average:  {results['avg_time']:.2f} ms\n")
+            parts.append(f"  Maximum:  {results['max_time']:.2f} ms\n")
         
         # Show individual times if available
         if results['times']:
-            print(f"\n📈 Individual Response Times:")
-            print("-" * 60)
-            for i, time in enumerate(results['times'], 1):
-                status = "🟢" if time < 50 else "🟡" if time < 150 else "🔴"
-                print(f"  Reply {i}: {status} {time:.2f} ms")
+            parts.append("\n📈 Individual Response Times:\n")
+            parts.append(_DASH60 + "\n")
+            for i, time_ms in enumerate(results['times'], 1):
+                status = _LATENCY_STATUS[0 if time_ms < 50 else 1 if time_ms < 150 else 2]
+                parts.append(f"  Reply {i}: {status} {time_ms:.2f} ms\n")
         
-        print("=" * 60 + "\n")
+        parts.append(_EQ60 + "\n\n")
+        sys.stdout.write(''.join(parts))
     
     def log_results(self, results):
         """Save ping results to log file"""
         try:
-            with open(self.log_file, 'a') as f:
-                f.write(f"\n{'=' * 60}\n")
-                f.write(f"Timestamp: {results.get('timestamp', 'N/A')}\n")
-                f.write(f"Target: {results.get('target', 'N/A')}\n")
-                f.write(f"Type: {results.get('target_type', 'N/A')}\n")
-                f.write(f"Success: {results['success']}\n")
-                
-                if results['success']:
-                    f.write(f"Packets Sent: {results['packets_sent']}\n")
-                    f.write(f"Packets Received: {results['packets_received']}\n")
-                    f.write(f"Packet Loss: {results['packet_loss']:.1f}%\n")
-                    if results['avg_time']:
-                        f.write(f"Avg Latency: {results['avg_time']:.2f} ms\n")
-                        f.write(f"Min Latency: {results['min_time']:.2f} ms\n")
-                        f.write(f"Max Latency: {results['max_time']:.2f} ms\n")
-                else:
-                    f.write(f"Error: {results.get('error', 'Unknown')}\n")
-                
-                f.write(f"{'=' * 60}\n")
+            entry = (
+                f"\n{_EQ60}\n"
+                f"Timestamp: {results.get('timestamp', 'N/A')}\n"
+                f"Target: {results.get('target', 'N/A')}\n"
+                f"Type: {results.get('target_type', 'N/A')}\n"
+                f"Success: {results['success']}\n"
+            )
+            
+            if results['success']:
+                entry += (
+                    f"Packets Sent: {results['packets_sent']}\n"
+                    f"Packets Received: {results['packets_received']}\n"
+                    f"Packet Loss: {results['packet_loss']:.1f}%\n"
+                )
+                if results['avg_time']:
+                    entry += (
+                        f"Avg Latency: {results['avg_time']:.2f} ms\n"
+                        f"Min Latency: {results['min_time']:.2f} ms\n"
+                        f"Max Latency: {results['max_time']:.2f} ms\n"
+                    )
+            else:
+                entry += f"Error: {results.get('error', 'Unknown')}\n"
+            
+            entry += f"{_EQ60}\n"
+            
+            # Straight to the descriptor, bypassing Python's IO layers; a
+            # regular file takes the whole entry in one write() call
+            fd = self._ensure_log()
+            data = memoryview(entry.encode('utf-8'))
+            while data:
+                data = data[os.write(fd, data):]
             
             return True
         except Exception as e:
             print(f"⚠️  Warning: Could not write to log file - {e}")
             return False
     
-    def view_logs(self):
-        """Display recent log entries"""
+    def view_logs(self, tail_bytes=65536):
+        """Display recent log entries (at most the last tail_bytes of the log)"""
         if not os.path.exists(self.log_file):
             print(f"\n📭 No log file found at '{self.log_file}'\n")
             return
         
         try:
-            with open(self.log_file, 'r') as f:
-                content = f.read()
-            
-            if not content.strip():
-                print(f"\n📭 Log file is empty\n")
-                return
-            
-            print(f"\n{'=' * 60}")
-            print(f"📄 PING LOGS ({self.log_file})")
-            print(f"{'=' * 60}")
-            print(content)
+            with open(self.log_file, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    print(f"\n📭 Log file is empty\n")
+                    return
+                
+                print(f"\n{_EQ60}")
+                print(f"📄 PING LOGS ({self.log_file})")
+                print(_EQ60)
+                
+                if tail_bytes is None or size <= tail_bytes:
+                    self._copy_to_stdout(f, size)
+                else:
+                    # Only read the end, starting at the first complete entry
+                    f.seek(size - tail_bytes)
+                    tail = f.read()
+                    start = tail.find(_LOG_ENTRY_START)
+                    print("(showing the most recent entries)")
+                    self._stream_to_stdout(io.BytesIO(tail[start + 1:] if start >= 0 else tail))
+            print()
             
         except Exception as e:
             print(f"❌ Error reading log file: {e}")
     
+    def _copy_to_stdout(self, f, size):
+        """Stream a binary file to stdout without loading it into memory"""
+        # Anything print()ed so far must reach the terminal first
+        sys.stdout.flush()
+        offset = 0
+        try:
+            # Linux: copy in kernel space, straight from the file to stdout
+            out_fd = sys.stdout.fileno()
+            while offset < size:
+                sent = os.sendfile(out_fd, f.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            # No sendfile (Windows), stdout isn't a valid target (macOS) or
+            # stdout has no file descriptor at all (IDLE, redirect_stdout)
+            f.seek(offset)
+            self._stream_to_stdout(f)
+    
+    def _stream_to_stdout(self, f):
+        """Copy the rest of a binary file (or BytesIO) to stdout in 64 KiB chunks"""
+        sys.stdout.flush()
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is not None:
+            shutil.copyfileobj(f, buffer, 65536)
+            buffer.flush()
+            return
+        
+        # Text-only stdout: decode as we go (the decoder keeps multi-byte
+        # characters that straddle a chunk boundary intact)
+        decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        for chunk in iter(lambda: f.read(65536), b''):
+            sys.stdout.write(decoder.decode(chunk))
+        sys.stdout.write(decoder.decode(b'', final=True))
+    
     def clear_logs(self):
         """Clear the log file"""
         try:
+            self.close()
             with open(self.log_file, 'w') as f:
                 f.write(f"# Ping Tool Logs - Cleared on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             print(f"✅ Logs cleared successfully!\n")
@@ -268,76 +627,145 @@ class PingTool:
 
 def show_menu():
     """Display main menu"""
-    print("\n" + "=" * 60)
+    print("\n" + _EQ60)
     print("🌐 NETWORK PING TOOL")
-    print("=" * 60)
+    print(_EQ60)
     print("\nOptions:")
     print("  1. Ping a host")
     print("  2. Quick ping (google.com)")
     print("  3. View logs")
     print("  4. Clear logs")
-    print("  5. Exit")
-    print("=" * 60)
+    print("  5. Ping hosts from file")
+    print("  6. Exit")
+    print(_EQ60)
 
 
-def main():
-    """Main application loop"""
-    tool = PingTool()
+def ask_ping_count():
+    """Prompt for the number of pings, falling back to 4"""
+    try:
+        count = int(input("Number of pings (default 4): ").strip() or "4")
+        if count < 1 or count > 100:
+            print("⚠️  Using default count of 4 (range: 1-100)")
+            count = 4
+    except ValueError:
+        print("⚠️  Invalid number, using default count of 4")
+        count = 4
+    return count
+
+
+def read_targets(path):
+    """Read one target per line, skipping blank lines and # comments"""
+    with open(path, 'r') as f:
+        return [
+            line.strip() for line in f
+            if line.strip() and not line.lstrip().startswith('#')
+        ]
+
+
+def ping_host(tool):
+    """Menu 1: ping a user-supplied host"""
+    target = input("\nEnter IP address or domain: ").strip()
+    if not target:
+        print("❌ No target entered.")
+        return
     
-    print("\n🚀 Welcome to Network Ping Tool!")
-    print("Test network connectivity and latency.\n")
+    count = ask_ping_count()
+    results = tool.ping(target, count)
+    tool.display_results(results)
     
-    while True:
-        show_menu()
-        
-        choice = input("\nEnter your choice (1-5): ").strip()
+    # Ask to save
+    save = input("Save to log file? (y/n): ").lower()
+    if save == 'y':
+        if tool.log_results(results):
+            print(f"✅ Results saved to {tool.log_file}\n")
+
+
+def quick_ping(tool):
+    """Menu 2: ping google.com and log the result"""
+    print("\n🔍 Quick ping to google.com...")
+    results = tool.ping("google.com", 4)
+    tool.display_results(results)
+    tool.log_results(results)
+    print(f"📝 Results logged to {tool.log_file}\n")
+
+
+def view_logs(tool):
+    """Menu 3: show recent log entries"""
+    tool.view_logs()
+
+
+def clear_logs(tool):
+    """Menu 4: clear the log file after confirmation"""
+    confirm = input("Are you sure you want to clear all logs? (y/n): ").lower()
+    if confirm == 'y':
+        tool.clear_logs()
+
+
+def ping_hosts_file(tool):
+    """Menu 5: ping every host listed in a file concurrently"""
+    path = input("\nEnter path to hosts file: ").strip()
+    try:
+        targets = read_targets(path)
+    except OSError as e:
+        print(f"❌ Could not read hosts file: {e}")
+        return
+    if not targets:
+        print("❌ No targets found in file.")
+        return
+    
+    count = ask_ping_count()
+    print(f"\n🔍 Pinging {len(targets)} hosts concurrently...")
+    all_results = asyncio.run(tool.ping_many(targets, count))
+    
+    for results in all_results:
+        print(f"\n{_EQ60}")
+        print(f"🌐 {results['target']}")
+        print(f"{_EQ60}\n")
+        tool.display_results(results)
+    
+    # Ask to save
+    save = input("Save to log file? (y/n): ").lower()
+    if save == 'y':
+        saved = sum(tool.log_results(results) for results in all_results)
+        print(f"✅ {saved} results saved to {tool.log_file}\n")
+
+
+def exit_tool(tool):
+    """Menu 6: say goodbye; returning True stops the main loop"""
+    print("\n👋 Thanks for using Network Ping Tool!")
+    print("Stay connected! 🌐\n")
+    return True
+
+
+def invalid_choice(tool):
+    """Fallback for unknown menu choices"""
+    print("❌ Invalid choice. Please enter 1-6.")
+
+
+# Menu choice -> handler; adding a menu item is one entry here
+MENU_ACTIONS = {
+    "1": ping_host,
+    "2": quick_ping,
+    "3": view_logs,
+    "4": clear_logs,
+    "5": ping_hosts_file,
+    "6": exit_tool,
+}
+
+
+def main():
+    """Main application loop"""
+    with PingTool() as tool:
+        print("\n🚀 Welcome to Network Ping Tool!")
+        print("Test network connectivity and latency.\n")
         
-        if choice == "1":
-            target = input("\nEnter IP address or domain: ").strip()
-            if not target:
-                print("❌ No target entered.")
-                continue
+        while True:
+            show_menu()
             
-            try:
-                count = int(input("Number of pings (default 4): ").strip() or "4")
-                if count < 1 or count > 100:
-                    print("⚠️  Using default count of 4 (range: 1-100)")
-                    count = 4
-            except ValueError:
-                print("⚠️  Invalid number, using default count of 4")
-                count = 4
-            
-            results = tool.ping(target, count)
-            tool.display_results(results)
+            choice = input("\nEnter your choice (1-6): ").strip()
             
-            # Ask to save
-            save = input("Save to log file? (y/n): ").lower()
-            if save == 'y':
-                if tool.log_results(results):
-                    print(f"✅ Results saved to {tool.log_file}\n")
-        
-        elif choice == "2":
-            print("\n🔍 Quick ping to google.com...")
-            results = tool.ping("google.com", 4)
-            tool.display_results(results)
-            tool.log_results(results)
-            print(f"📝 Results logged to {tool.log_file}\n")
-        
-        elif choice == "3":
-            tool.view_logs()
-        
-        elif choice == "4":
-            confirm = input("Are you sure you want to clear all logs? (y/n): ").lower()
-            if confirm == 'y':
-                tool.clear_logs()
-        
-        elif choice == "5":
-            print("\n👋 Thanks for using Network Ping Tool!")
-            print("Stay connected! 🌐\n")
-            break
-        
-        else:
-            print("❌ Invalid choice. Please enter 1-5.")
+            if MENU_ACTIONS.get(choice, invalid_choice)(tool):
+                break
 
 
 if __name__ == "__main__":